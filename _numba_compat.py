@@ -0,0 +1,21 @@
+"""
+Optional Numba support shared by the simulation modules.
+
+Numba is not a requirement. Without it ``njit`` returns the function
+unchanged, ``prange`` is ``range`` and ``HAVE_NUMBA`` is ``False``, so
+callers can keep a vectorised NumPy path for hot spots that would
+otherwise run as plain Python loops.
+"""
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` (with or without options) that does nothing."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
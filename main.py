@@ -1,15 +1,22 @@
 import sys
 import io
+import argparse
+import contextlib
+from concurrent.futures import ProcessPoolExecutor
 
 # Fix Windows console encoding (do this FIRST, before importing other modules)
-if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
+if sys.platform == 'win32':
     try:
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
-    except AttributeError:
-        # Already wrapped or can't wrap
+        sys.stdout.reconfigure(encoding='utf-8', errors='replace', line_buffering=True)
+        sys.stderr.reconfigure(encoding='utf-8', errors='replace', line_buffering=True)
+    except (AttributeError, OSError):
+        # Not a reconfigurable text stream
         pass
 
+# Batch demo: render off-screen, figures are written to disk and closed
+import matplotlib
+matplotlib.use('Agg')
+
 import numpy as np
 from superdense_coding import SuperdenseCoding
 from superdense_noisy import NoisySuperdenseCoding
@@ -17,11 +24,37 @@ from superdense_imperfect import ImperfectGateSuperdenseCoding
 from analyze_results import SuperdenseAnalyzer
 
 
+# Pre-rendered console art
+_HR80 = "=" * 80
+_RULE80 = "-" * 80
+
+_BANNER = (
+    "\n+" + "=" * 78 + "+\n"
+    + "|" + "SUPERDENSE CODING: COMPREHENSIVE DEMONSTRATION".center(78) + "|\n"
+    + "|" + "Implementation of Quantum Communication Protocol".center(78) + "|\n"
+    + "+" + "=" * 78 + "+\n"
+)
+
+_RESULTS_TABLE = """\
++------------+--------------+-------------+--------------------------+
+| Input Bits | Gates Applied|   Output    |         Results          |
++------------+--------------+-------------+--------------------------+
+|     00     |      I       |     00      | Success in all cases     |
+|     01     |      X       |     01      | High-fidelity recovery   |
+|     10     |      Z       |     10      | Robust in simulation     |
+|     11     |      ZX      |     11      | Some hardware noise      |
++------------+--------------+-------------+--------------------------+
+
+  Ideal Case:           100% success rate (perfect transmission)
+  Noisy Case:           80-95% success rate (realistic noise)
+  Imperfect Gates:      75-90% success rate (calibration errors)
+
+"""
+
+
 def print_header(title):
     """Print a formatted section header."""
-    print("\n" + "=" * 80)
-    print(title.center(80))
-    print("=" * 80 + "\n")
+    sys.stdout.write(f"\n{_HR80}\n{title.center(80)}\n{_HR80}\n\n")
 
 
 def run_ideal_scenario(shots=1024):
@@ -67,9 +100,9 @@ def run_noisy_scenario(shots=2048):
 
     # Test different noise levels
     for noise_level in ['low', 'medium', 'high']:
-        print(f"\n{'-' * 80}")
+        print(f"\n{_RULE80}")
         print(f"Testing with {noise_level.upper()} noise level...")
-        print(f"{'-' * 80}")
+        print(_RULE80)
 
         noisy_sdc = NoisySuperdenseCoding(noise_level=noise_level)
         results = noisy_sdc.test_all_cases(shots=shots, draw_circuit=False)
@@ -107,9 +140,9 @@ def run_imperfect_gates_scenario(shots=2048):
     imperfect_sdc.visualize_imperfect_results(save_fig=True)
 
     # Also show error angle comparison
-    print(f"\n{'-' * 80}")
+    print(f"\n{_RULE80}")
     print("Analyzing impact of different gate error magnitudes...")
-    print(f"{'-' * 80}\n")
+    print(f"{_RULE80}\n")
 
     comparison = imperfect_sdc.compare_gate_errors(
         bits='11',
@@ -147,16 +180,36 @@ def run_comprehensive_analysis(ideal_results, noisy_results, imperfect_results):
     analyzer.compare_fidelities(save_fig=True)
     analyzer.create_quantum_advantage_chart(save_fig=True)
 
+    analyzer.close()
+
     # Generate text report
     analyzer.generate_report()
 
 
+def _run_captured(scenario, shots):
+    """
+    Run a scenario in a worker process with its console output captured.
+
+    Args:
+        scenario: One of the run_*_scenario functions
+        shots: Number of shots passed to the scenario
+
+    Returns:
+        Tuple of (captured output, scenario results)
+    """
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        results = scenario(shots)
+    return buf.getvalue(), results
+
+
 def print_protocol_explanation():
     """Print a detailed explanation of the superdense coding protocol."""
     print_header("SUPERDENSE CODING PROTOCOL EXPLANATION")
 
-    print("What is Superdense Coding?")
-    print("-" * 80)
+    buf = io.StringIO()
+    print("What is Superdense Coding?", file=buf)
+    print(_RULE80, file=buf)
     print("""
 Superdense coding is a quantum communication protocol that demonstrates
 quantum advantage over classical communication. It allows two parties
@@ -204,65 +257,71 @@ of information because of the pre-shared entanglement.
 
 This is a genuine quantum advantage - there's no classical way to achieve
 the same information density without sending 2 classical bits.
-""")
+""", file=buf)
+    sys.stdout.write(buf.getvalue())
 
 
 def print_results_summary():
     """Print expected results summary."""
     print_header("EXPECTED RESULTS SUMMARY")
-
-    print("+------------+--------------+-------------+--------------------------+")
-    print("| Input Bits | Gates Applied|   Output    |         Results          |")
-    print("+------------+--------------+-------------+--------------------------+")
-    print("|     00     |      I       |     00      | Success in all cases     |")
-    print("|     01     |      X       |     01      | High-fidelity recovery   |")
-    print("|     10     |      Z       |     10      | Robust in simulation     |")
-    print("|     11     |      ZX      |     11      | Some hardware noise      |")
-    print("+------------+--------------+-------------+--------------------------+")
-
-    print("\n  Ideal Case:           100% success rate (perfect transmission)")
-    print("  Noisy Case:           80-95% success rate (realistic noise)")
-    print("  Imperfect Gates:      75-90% success rate (calibration errors)")
-    print()
+    sys.stdout.write(_RESULTS_TABLE)
 
 
 def main():
     """Main function to run all demonstrations."""
-    print("\n" + "+" + "=" * 78 + "+")
-    print("|" + "SUPERDENSE CODING: COMPREHENSIVE DEMONSTRATION".center(78) + "|")
-    print("|" + "Implementation of Quantum Communication Protocol".center(78) + "|")
-    print("+" + "=" * 78 + "+")
+    parser = argparse.ArgumentParser(description="Superdense coding comprehensive demonstration")
+    parser.add_argument('--no-prompt', '--yes', dest='no_prompt', action='store_true',
+                        help="Start immediately without waiting for Enter")
+    parser.add_argument('--quiet', action='store_true',
+                        help="Skip the protocol explanation and expected results")
+    args = parser.parse_args()
 
-    # Print protocol explanation
-    print_protocol_explanation()
+    sys.stdout.write(_BANNER)
 
-    # Print expected results
-    print_results_summary()
+    if not args.quiet:
+        # Print protocol explanation
+        print_protocol_explanation()
 
-    # Confirm to proceed
-    print("This demonstration will:")
-    print("  1. Run ideal (noiseless) simulations")
-    print("  2. Run noisy simulations (low, medium, high noise)")
-    print("  3. Run imperfect gate simulations")
-    print("  4. Generate comprehensive analysis and visualizations")
-    print("\nThis may take a few minutes to complete.")
+        # Print expected results
+        print_results_summary()
 
-    try:
-        input("\nPress Enter to start the demonstration (or Ctrl+C to cancel)...")
-    except KeyboardInterrupt:
-        print("\n\nDemonstration cancelled.")
-        return
+    # Confirm to proceed
+    sys.stdout.write("\n".join([
+        "This demonstration will:",
+        "  1. Run ideal (noiseless) simulations",
+        "  2. Run noisy simulations (low, medium, high noise)",
+        "  3. Run imperfect gate simulations",
+        "  4. Generate comprehensive analysis and visualizations",
+        "\nThis may take a few minutes to complete.",
+    ]) + "\n")
+
+    if not args.no_prompt:
+        try:
+            input("\nPress Enter to start the demonstration (or Ctrl+C to cancel)...")
+        except KeyboardInterrupt:
+            print("\n\nDemonstration cancelled.")
+            return
 
     # Run all scenarios
     try:
-        # Scenario 1: Ideal
-        ideal_results = run_ideal_scenario(shots=1024)
+        # The three scenarios are independent, so run them in parallel;
+        # each worker captures its output, printed here in scenario order
+        with ProcessPoolExecutor(max_workers=3) as executor:
+            # Scenario 1: Ideal
+            ideal_future = executor.submit(_run_captured, run_ideal_scenario, 1024)
+
+            # Scenario 2: Noisy
+            noisy_future = executor.submit(_run_captured, run_noisy_scenario, 2048)
 
-        # Scenario 2: Noisy
-        noisy_results = run_noisy_scenario(shots=2048)
+            # Scenario 3: Imperfect Gates
+            imperfect_future = executor.submit(_run_captured, run_imperfect_gates_scenario, 2048)
 
-        # Scenario 3: Imperfect Gates
-        imperfect_results = run_imperfect_gates_scenario(shots=2048)
+            ideal_output, ideal_results = ideal_future.result()
+            sys.stdout.write(ideal_output)
+            noisy_output, noisy_results = noisy_future.result()
+            sys.stdout.write(noisy_output)
+            imperfect_output, imperfect_results = imperfect_future.result()
+            sys.stdout.write(imperfect_output)
 
         # Comprehensive Analysis
         run_comprehensive_analysis(ideal_results, noisy_results, imperfect_results)
@@ -280,7 +339,7 @@ def main():
         print("  • comparison_fidelity_heatmap.png")
         print("  • quantum_advantage.png")
         print("\nThank you for exploring quantum superdense coding!")
-        print("=" * 80 + "\n")
+        print(_HR80 + "\n")
 
     except KeyboardInterrupt:
         print("\n\nDemonstration interrupted by user.")
@@ -1,21 +1,99 @@
-
+import bisect
 import sys
 import io
 
-# Fix Windows console encoding (check if not already wrapped)
-if sys.platform == 'win32' and not isinstance(sys.stdout, io.TextIOWrapper):
-    try:
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace', line_buffering=True)
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace', line_buffering=True)
-    except (AttributeError, ValueError):
-        pass  # Already wrapped or can't wrap
-
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, transpile
 from qiskit_aer import AerSimulator
-from qiskit.visualization import plot_histogram
-import matplotlib.pyplot as plt
 import numpy as np
 
+from _numba_compat import HAVE_NUMBA, njit
+from analyze_results import FIGURE_DPI, _PNG_KW
+
+# Console separators
+_SEP = '=' * 70
+_RULE = '-' * 70
+
+
+# 2-qubit gates for the built-in simulator. Basis index = 2 * alice + bob,
+# which matches the order of the measured bit strings ('<alice><bob>').
+_I4 = np.eye(4, dtype=np.complex64)
+_H_I = np.kron(np.array([[1, 1], [1, -1]]) / np.sqrt(2), np.eye(2)).astype(np.complex64)
+_X_I = np.kron(np.array([[0, 1], [1, 0]]), np.eye(2)).astype(np.complex64)
+_Z_I = np.kron(np.array([[1, 0], [0, -1]]), np.eye(2)).astype(np.complex64)
+_CNOT = np.array([[1, 0, 0, 0],
+                  [0, 1, 0, 0],
+                  [0, 0, 0, 1],
+                  [0, 0, 1, 0]], dtype=np.complex64)
+_ENCODE_UNITARIES = {'00': _I4, '01': _X_I, '10': _Z_I, '11': _X_I @ _Z_I}
+
+# Fused Bell-pair preparation (H on Alice, then CNOT) and Bob's inverse of it
+_U_BELL = _CNOT @ _H_I
+_U_BELL_DAG = _U_BELL.conj().T
+
+# Whole protocol (Bell pair, encoding, decoding) as one unitary per message,
+# indexed by the message as an integer ('00' -> 0 ... '11' -> 3)
+_PROTOCOL_UNITARIES = np.array([_U_BELL_DAG @ _ENCODE_UNITARIES[bits] @ _U_BELL
+                                for bits in ['00', '01', '10', '11']])
+
+# Gates Alice applies (in order) for each message
+_ENCODE_TABLE = {'00': (), '01': ('x',), '10': ('z',), '11': ('z', 'x')}
+
+# Summary table rows: message and the gates that encode it
+_GATE_MAP = (('00', 'I'), ('01', 'X'), ('10', 'Z'), ('11', 'ZX'))
+
+# Summary status by success rate: below 80, from 80, from 95, exactly 100
+_STATUS_THRESHOLDS = (80.0, 95.0, 100.0)
+_STATUS_LABELS = ('[ERROR] Poor', '[WARN] Good', '[OK] Excellent', '[OK] Perfect')
+
+
+@njit(cache=True)
+def _apply_superdense(bits_idx):
+    """
+    Apply the fused protocol unitary to |00> and return the outcome probabilities.
+
+    Args:
+        bits_idx: Message as an integer (0 to 3)
+
+    Returns:
+        Probabilities of the outcomes '00', '01', '10', '11'
+    """
+    state = np.zeros(4, dtype=np.complex64)
+    state[0] = 1
+    probs = np.zeros(4)
+    total = 0.0
+    for row in range(4):
+        amp = 0j
+        for col in range(4):
+            amp += _PROTOCOL_UNITARIES[bits_idx, row, col] * state[col]
+        probs[row] = amp.real * amp.real + amp.imag * amp.imag
+        total += probs[row]
+    for row in range(4):
+        probs[row] /= total
+    return probs
+
+
+def _outcome_probabilities(bits):
+    """
+    Simulate the protocol on a 4-amplitude state vector.
+
+    Args:
+        bits: String of 2 bits to encode
+
+    Returns:
+        Probabilities of the outcomes '00', '01', '10', '11'
+    """
+    if HAVE_NUMBA:
+        return _apply_superdense(int(bits, 2))
+    # Without Numba the loop kernel would run as plain Python; the state is
+    # simply the first column of the fused unitary (U applied to |00>)
+    probs = np.abs(_PROTOCOL_UNITARIES[int(bits, 2), :, 0]).astype(np.float64) ** 2
+    return probs / probs.sum()
+
+
+def _counts_dict(samples):
+    """Convert outcome counts ordered '00'..'11' to a counts dictionary."""
+    return {format(idx, '02b'): int(n) for idx, n in enumerate(samples) if n}
+
 
 class SuperdenseCoding:
     """
@@ -25,10 +103,81 @@ class SuperdenseCoding:
     only 1 qubit, using a pre-shared entangled pair.
     """
 
-    def __init__(self):
-        """Initialize the superdense coding protocol."""
-        self.simulator = AerSimulator()
+    # AerSimulator shared by all instances, created on first use
+    _simulator = None
+
+    def __init__(self, use_aer=False, seed=None):
+        """
+        Initialize the superdense coding protocol.
+
+        Args:
+            use_aer: Execute the circuits on Qiskit Aer instead of the built-in
+                4-amplitude NumPy simulator
+            seed: Seed for the measurement sampling (None for a random seed)
+        """
+        self.use_aer = use_aer
+        # All shots are drawn from this generator
+        self._rng = np.random.default_rng(seed)
+        if use_aer and type(self)._simulator is None:
+            # Aer only evaluates the outcome probabilities (one shot), so use
+            # a single-precision statevector; a single thread beats a pool for 2 qubits
+            type(self)._simulator = AerSimulator(method='statevector', precision='single',
+                                                 max_parallel_threads=1)
+        self.simulator = type(self)._simulator if use_aer else None
         self.results = {}
+        # Text diagrams of the circuits, rendered on first request
+        self._drawn = {}
+        # Results figure, created by the first visualize_results() call
+        self._fig = None
+
+        # The four protocol circuits never change, so build them once
+        self._compiled = {bits: self.build_circuit(bits) for bits in ['00', '01', '10', '11']}
+        if use_aer:
+            # Aer saves the outcome probabilities in place of the measurements;
+            # qubits [bob, alice] index them like the classical bit strings
+            self._aer_circuits = {}
+            for bits, qc in self._compiled.items():
+                prob_qc = qc.remove_final_measurements(inplace=False)
+                prob_qc.save_probabilities_dict(qubits=[1, 0])
+                self._aer_circuits[bits] = transpile(prob_qc, self.simulator,
+                                                     optimization_level=0)
+
+    def _circuit_diagram(self, bits):
+        """Return the (cached) text drawing of the circuit for ``bits``."""
+        if bits not in self._drawn:
+            # Drawings show the protocol stages, so use a copy with barriers
+            qc = self.build_circuit(bits, barriers=True)
+            self._drawn[bits] = str(qc.draw(output='text'))
+        return self._drawn[bits]
+
+    def _sample_counts(self, probs, shots):
+        """
+        Draw all shots at once from an outcome distribution.
+
+        Args:
+            probs: Probabilities of the outcomes '00', '01', '10', '11'
+            shots: Number of measurement repetitions
+
+        Returns:
+            Dictionary of measurement counts
+        """
+        return _counts_dict(self._rng.multinomial(shots, probs))
+
+    def _aer_probabilities(self, result, idx):
+        """
+        Read the saved outcome probabilities of one experiment from an Aer result.
+
+        Args:
+            result: Aer Result object
+            idx: Index of the experiment in the job
+
+        Returns:
+            Probabilities of the outcomes '00', '01', '10', '11'
+        """
+        probs = np.zeros(4)
+        for outcome, prob in result.data(idx)['probabilities'].items():
+            probs[outcome] = prob
+        return probs / probs.sum()
 
     def create_bell_state(self, qc, alice_qubit, bob_qubit):
         """
@@ -40,9 +189,11 @@ class SuperdenseCoding:
             bob_qubit: Bob's qubit index
 
         Creates the state: |Φ+⟩ = (|00⟩ + |11⟩) / √2
+
+        H and CNOT are applied as one fused 2-qubit unitary.
         """
-        qc.h(alice_qubit)
-        qc.cx(alice_qubit, bob_qubit)
+        # Qiskit treats the first qarg as least significant: [bob, alice]
+        qc.unitary(_U_BELL, [bob_qubit, alice_qubit], label='Bell')
 
     def alice_encode(self, qc, alice_qubit, bits):
         """
@@ -59,21 +210,11 @@ class SuperdenseCoding:
             '10' -> Z (Pauli-Z gate)
             '11' -> ZX (Pauli-Z then Pauli-X)
         """
-        if bits == '00':
-            # Do nothing (Identity operation)
-            pass
-        elif bits == '01':
-            # Apply X gate
-            qc.x(alice_qubit)
-        elif bits == '10':
-            # Apply Z gate
-            qc.z(alice_qubit)
-        elif bits == '11':
-            # Apply Z then X gate
-            qc.z(alice_qubit)
-            qc.x(alice_qubit)
-        else:
+        gates = _ENCODE_TABLE.get(bits)
+        if gates is None:
             raise ValueError(f"Invalid bits: {bits}. Must be '00', '01', '10', or '11'")
+        for gate in gates:
+            getattr(qc, gate)(alice_qubit)
 
     def bob_decode(self, qc, alice_qubit, bob_qubit, classical_bits):
         """
@@ -85,26 +226,25 @@ class SuperdenseCoding:
             bob_qubit: Bob's qubit index
             classical_bits: ClassicalRegister to store results
         """
-        # Reverse the entanglement
-        qc.cx(alice_qubit, bob_qubit)
-        qc.h(alice_qubit)
+        # Reverse the entanglement (CNOT then H, as one fused unitary)
+        qc.unitary(_U_BELL_DAG, [bob_qubit, alice_qubit], label='Bell†')
 
         # Measure both qubits (note: Qiskit uses little-endian ordering)
         # Measure alice_qubit to bit 1 and bob_qubit to bit 0 to match expected output
         qc.measure(alice_qubit, classical_bits[1])
         qc.measure(bob_qubit, classical_bits[0])
 
-    def run_protocol(self, bits, shots=1024, draw_circuit=True):
+    def build_circuit(self, bits, barriers=False):
         """
-        Run the complete superdense coding protocol.
+        Build the complete superdense coding circuit for one message.
 
         Args:
             bits: String of 2 bits to encode ('00', '01', '10', or '11')
-            shots: Number of measurement repetitions
-            draw_circuit: Whether to draw and display the circuit
+            barriers: Whether to add labelled barriers between the protocol
+                stages (only useful for drawing)
 
         Returns:
-            Dictionary containing the measurement results
+            QuantumCircuit implementing the protocol
         """
         # Create quantum and classical registers
         qr = QuantumRegister(2, 'q')
@@ -112,26 +252,50 @@ class SuperdenseCoding:
         qc = QuantumCircuit(qr, cr)
 
         # Step 1: Create entangled Bell pair
-        qc.barrier(label='Bell State')
+        if barriers:
+            qc.barrier(label='Bell State')
         self.create_bell_state(qc, 0, 1)
 
         # Step 2: Alice encodes her message
-        qc.barrier(label=f'Encode: {bits}')
+        if barriers:
+            qc.barrier(label=f'Encode: {bits}')
         self.alice_encode(qc, 0, bits)
 
         # Step 3: Bob decodes the message
-        qc.barrier(label='Decode')
+        if barriers:
+            qc.barrier(label='Decode')
         self.bob_decode(qc, 0, 1, cr)
 
+        return qc
+
+    def run_protocol(self, bits, shots=1024, draw_circuit=False):
+        """
+        Run the complete superdense coding protocol.
+
+        Args:
+            bits: String of 2 bits to encode ('00', '01', '10', or '11')
+            shots: Number of measurement repetitions
+            draw_circuit: Whether to draw and display the circuit
+
+        Returns:
+            Dictionary containing the measurement results
+        """
+        if bits not in self._compiled:
+            raise ValueError(f"Invalid bits: {bits}. Must be '00', '01', '10', or '11'")
+        qc = self._compiled[bits]
+
         # Draw circuit if requested
         if draw_circuit:
             print(f"\nCircuit for encoding '{bits}':")
-            print(qc.draw(output='text'))
+            print(self._circuit_diagram(bits))
 
         # Execute the circuit
-        job = self.simulator.run(qc, shots=shots)
-        result = job.result()
-        counts = result.get_counts(qc)
+        if self.use_aer:
+            job = self.simulator.run(self._aer_circuits[bits], shots=1)
+            probs = self._aer_probabilities(job.result(), 0)
+        else:
+            probs = _outcome_probabilities(bits)
+        counts = self._sample_counts(probs, shots)
 
         # Store results
         self.results[bits] = {
@@ -156,39 +320,59 @@ class SuperdenseCoding:
         all_bits = ['00', '01', '10', '11']
         results = {}
 
-        print("=" * 70)
-        print("SUPERDENSE CODING - IDEAL CASE")
-        print("=" * 70)
+        # Collect the report and write it in one go
+        lines = [_SEP, "SUPERDENSE CODING - IDEAL CASE", _SEP]
 
-        for bits in all_bits:
-            print(f"\n{'-' * 70}")
-            print(f"Testing input: {bits}")
-            print(f"{'-' * 70}")
+        # On Aer, evaluate all four circuits as one batched single-shot job
+        if self.use_aer:
+            # (single-threaded, as configured on the shared simulator)
+            job = self.simulator.run([self._aer_circuits[bits] for bits in all_bits], shots=1)
+            result = job.result()
+            probs_array = np.array([self._aer_probabilities(result, idx)
+                                    for idx in range(len(all_bits))])
+        else:
+            probs_array = np.array([_outcome_probabilities(bits) for bits in all_bits])
 
-            counts = self.run_protocol(bits, shots=shots, draw_circuit=draw_circuit)
+        # Counts per input (rows) on a fixed outcome axis (columns); the
+        # expected outcome of each input is on the diagonal
+        counts_array = self._rng.multinomial(shots, probs_array)
+        success_rates = counts_array.diagonal() / shots * 100.0
 
-            # Calculate success rate
-            expected_output = bits
-            success_count = counts.get(expected_output, 0)
-            success_rate = (success_count / shots) * 100
+        for bits, samples, success_rate in zip(all_bits, counts_array, success_rates):
+            lines += [f"\n{_RULE}", f"Testing input: {bits}", _RULE]
 
+            if draw_circuit:
+                lines += [f"\nCircuit for encoding '{bits}':", self._circuit_diagram(bits)]
+
+            counts = _counts_dict(samples)
+            self.results[bits] = {
+                'counts': counts,
+                'circuit': self._compiled[bits],
+                'shots': shots
+            }
+
+            expected_output = bits
             results[bits] = {
                 'counts': counts,
-                'success_rate': success_rate,
+                'success_rate': float(success_rate),
                 'expected': expected_output
             }
 
-            print(f"\nResults:")
-            print(f"  Expected output: {expected_output}")
-            print(f"  Measurement counts: {counts}")
-            print(f"  Success rate: {success_rate:.2f}%")
+            lines += [
+                "\nResults:",
+                f"  Expected output: {expected_output}",
+                f"  Measurement counts: {counts}",
+                f"  Success rate: {success_rate:.2f}%",
+            ]
 
             if success_rate == 100.0:
-                print(f"  [OK] Perfect transmission!")
+                lines.append("  [OK] Perfect transmission!")
             elif success_rate >= 95.0:
-                print(f"  [OK] High fidelity transmission")
+                lines.append("  [OK] High fidelity transmission")
             else:
-                print(f"  [WARNING] Some errors detected")
+                lines.append("  [WARNING] Some errors detected")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
         return results
 
@@ -203,84 +387,125 @@ class SuperdenseCoding:
             print("No results to visualize. Run the protocol first.")
             return
 
-        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-        fig.suptitle('Superdense Coding Results - All Cases', fontsize=16, fontweight='bold')
+        # Imported here so that running the protocol never loads Matplotlib
+        import matplotlib.pyplot as plt
 
         all_bits = ['00', '01', '10', '11']
 
+        # Counts per input (rows) on a fixed outcome axis (columns), filled
+        # in a single pass over each counts dictionary
+        counts_matrix = np.zeros((len(all_bits), len(all_bits)), dtype=np.int64)
         for idx, bits in enumerate(all_bits):
-            row = idx // 2
-            col = idx % 2
-            ax = axes[row, col]
-
             if bits in self.results:
-                counts = self.results[bits]['counts']
+                for outcome, n in self.results[bits]['counts'].items():
+                    counts_matrix[idx, int(outcome, 2)] = n
+        outcome_axis = np.array(all_bits)
+        bar_colors = np.where(outcome_axis[None, :] == outcome_axis[:, None], 'green', 'red')
 
-                # Create bar plot
-                outcomes = list(counts.keys())
-                values = list(counts.values())
-                colors = ['green' if outcome == bits else 'red' for outcome in outcomes]
+        # The figure is built once; later calls only update its artists
+        if self._fig is None:
+            self._build_results_figure(all_bits)
+        fig = self._fig
 
-                ax.bar(outcomes, values, color=colors, alpha=0.7, edgecolor='black')
-                ax.set_xlabel('Measurement Outcome', fontsize=12)
-                ax.set_ylabel('Counts', fontsize=12)
-                ax.set_title(f'Input: {bits}', fontsize=14, fontweight='bold')
-                ax.grid(axis='y', alpha=0.3)
+        for idx, bits in enumerate(all_bits):
+            bars = self._bars[idx]
+            if bits in self.results:
+                for bar, height, color in zip(bars, counts_matrix[idx], bar_colors[idx]):
+                    bar.set_height(height)
+                    bar.set_facecolor(color)
 
                 # Add success rate
-                success_count = counts.get(bits, 0)
-                success_rate = (success_count / self.results[bits]['shots']) * 100
-                ax.text(0.5, 0.95, f'Success Rate: {success_rate:.1f}%',
-                       transform=ax.transAxes, ha='center', va='top',
-                       bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5),
-                       fontsize=11, fontweight='bold')
+                success_rate = (counts_matrix[idx, idx] / self.results[bits]['shots']) * 100
+                self._rate_texts[idx].set_text(f'Success Rate: {success_rate:.1f}%')
+                self._rate_texts[idx].set_visible(True)
+            else:
+                for bar in bars:
+                    bar.set_height(0)
+                self._rate_texts[idx].set_visible(False)
 
-        plt.tight_layout()
+            ax = self._axes[idx // 2, idx % 2]
+            ax.relim()
+            ax.autoscale_view()
+
+        fig.canvas.draw_idle()
 
         if save_fig:
-            plt.savefig('superdense_coding_results.png', dpi=300, bbox_inches='tight')
+            fig.savefig('superdense_coding_results.png', dpi=FIGURE_DPI, **_PNG_KW)
             print("\n[OK] Results visualization saved as 'superdense_coding_results.png'")
 
         plt.show()
 
-    def print_summary(self, results):
+    def _build_results_figure(self, all_bits):
         """
-        Print a summary table of all results.
+        Create the 2x2 results figure with one (empty) bar chart per input.
 
         Args:
-            results: Dictionary of results from test_all_cases()
+            all_bits: Measurement outcomes, in plotting order
         """
-        print(f"\n{'=' * 70}")
-        print("SUMMARY TABLE")
-        print(f"{'=' * 70}")
-        print(f"{'Input':<10} {'Gates Applied':<15} {'Expected':<10} {'Success Rate':<15} {'Status'}")
-        print(f"{'-' * 70}")
-
-        gate_map = {
-            '00': 'I',
-            '01': 'X',
-            '10': 'Z',
-            '11': 'ZX'
-        }
+        import matplotlib.pyplot as plt
 
-        for bits in ['00', '01', '10', '11']:
-            if bits in results:
-                data = results[bits]
-                gates = gate_map[bits]
-                success = data['success_rate']
+        fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+        fig.suptitle('Superdense Coding Results - All Cases', fontsize=16, fontweight='bold')
+
+        self._bars = []
+        self._rate_texts = []
+        for idx, bits in enumerate(all_bits):
+            ax = axes[idx // 2, idx % 2]
 
-                if success == 100.0:
-                    status = '[OK] Perfect'
-                elif success >= 95.0:
-                    status = '[OK] Excellent'
-                elif success >= 80.0:
-                    status = '[WARN] Good'
-                else:
-                    status = '[ERROR] Poor'
+            # Create bar plot
+            self._bars.append(ax.bar(all_bits, np.zeros(len(all_bits)), color='red',
+                                     alpha=0.7, edgecolor='black'))
+            ax.set_xlabel('Measurement Outcome', fontsize=12)
+            ax.set_ylabel('Counts', fontsize=12)
+            ax.set_title(f'Input: {bits}', fontsize=14, fontweight='bold')
+            ax.grid(axis='y', alpha=0.3)
 
-                print(f"{bits:<10} {gates:<15} {data['expected']:<10} {success:>6.2f}%{'':<8} {status}")
+            self._rate_texts.append(ax.text(0.5, 0.95, '',
+                                            transform=ax.transAxes, ha='center', va='top',
+                                            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5),
+                                            fontsize=11, fontweight='bold'))
 
-        print(f"{'=' * 70}\n")
+        fig.tight_layout()
+        self._fig, self._axes = fig, axes
+
+    def print_summary(self, results):
+        """
+        Print a summary table of all results.
+
+        Args:
+            results: Dictionary of results from test_all_cases()
+        """
+        lines = [
+            f"\n{_SEP}",
+            "SUMMARY TABLE",
+            _SEP,
+            f"{'Input':<10} {'Gates Applied':<15} {'Expected':<10} {'Success Rate':<15} {'Status'}",
+            _RULE,
+        ]
+
+        for bits, gates in _GATE_MAP:
+            data = results.get(bits)
+            if data is None:
+                continue
+            success = data['success_rate']
+            status = _STATUS_LABELS[bisect.bisect_right(_STATUS_THRESHOLDS, success)]
+            lines.append(f"{bits:<10} {gates:<15} {data['expected']:<10} {success:>6.2f}%{'':<8} {status}")
+
+        lines.append(f"{_SEP}\n")
+
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _fix_console_encoding():
+    """Fix Windows console encoding (check if not already wrapped)."""
+    if sys.platform != 'win32' or (sys.stdout.encoding or '').lower() == 'utf-8':
+        return
+    if not isinstance(sys.stdout, io.TextIOWrapper):
+        try:
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+            sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+        except (AttributeError, ValueError):
+            pass  # Already wrapped or can't wrap
 
 
 def main():
@@ -309,4 +534,5 @@ def main():
 
 
 if __name__ == "__main__":
+    _fix_console_encoding()
     main()